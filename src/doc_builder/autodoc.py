@@ -13,10 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import importlib
 import inspect
 import json
 import re
+import types
 
 from .convert_md_to_mdx import convert_md_docstring_to_mdx
 from .convert_rst_to_mdx import convert_rst_docstring_to_mdx, find_indent, is_empty_line
@@ -25,12 +27,19 @@ from .external import HUGGINFACE_LIBS, get_external_object_link
 
 def find_object_in_package(object_name, package):
     """
-    Find an object from its name inside a given package.
+    Find an object from its name inside a given package. Results are cached since the same objects are looked up for
+    every link to them in the documentation.
 
     Args:
     - **object_name** (`str`) -- The name of the object to retrieve.
     - **package** (`types.ModuleType`) -- The package to look into.
     """
+    # `lru_cache` keys depend on how arguments are passed, so always call the cached function with positional ones.
+    return _find_object_in_package(object_name, package)
+
+
+@functools.lru_cache(maxsize=None)
+def _find_object_in_package(object_name, package):
     path_splits = object_name.split(".")
     if path_splits[0] == package.__name__:
         path_splits = path_splits[1:]
@@ -53,11 +62,15 @@ def find_object_in_package(object_name, package):
     return module
 
 
+# Re pattern that catches all the opening and closing example tags
+_re_all_example_tags = re.compile(r"</?example(?:title)?>")
+
+
 def remove_example_tags(text):
-    tags = ["<exampletitle>", "</exampletitle>", "<example>", "</example>"]
-    for tag in tags:
-        text = text.replace(tag, "")
-    return text
+    # Most docstrings have no example tags, so skip the regex pass in that case.
+    if "example" not in text:
+        return text
+    return _re_all_example_tags.sub("", text)
 
 
 def get_shortest_path(obj, package):
@@ -86,14 +99,28 @@ def get_shortest_path(obj, package):
     return ".".join(path_splits[: idx + 1]) + "." + long_name
 
 
+# The same annotations (`Optional[torch.Tensor]`, `int`...) come back in most signatures and the string representation
+# of typing objects is built recursively, so we keep the names already computed. The cache is keyed by identity and not
+# equality since equal annotations can have different representations (`Union[int, str] == Union[str, int]`), and the
+# annotation is stored along its name so its id can't be reused.
+_type_name_cache = {}
+
+
 def get_type_name(typ):
     """
     Returns the name of the type passed, properly dealing with type annotations.
     """
+    cached = _type_name_cache.get(id(typ))
+    if cached is not None and cached[0] is typ:
+        return cached[1]
+
     if isinstance(typ, type):
         # If it's a class, use its name.
-        return getattr(typ, "__qualname__", None) or getattr(typ, "__name__", None) or str(typ)
-    return str(typ)  # otherwise, trust its string representation
+        type_name = getattr(typ, "__qualname__", None) or getattr(typ, "__name__", None) or str(typ)
+    else:
+        type_name = str(typ)  # otherwise, trust its string representation
+    _type_name_cache[id(typ)] = (typ, type_name)
+    return type_name
 
 
 def format_signature(obj):
@@ -140,6 +167,74 @@ _re_example_tags = re.compile(r"(<exampletitle>|<example>)")
 _re_parameter_group = re.compile(r"^> (.*)$", re.MULTILINE)
 _re_raises = re.compile(r"<raises>(.*)</raises>", re.DOTALL)
 _re_raisederrors = re.compile(r"<raisederrors>(.*)</raisederrors>", re.DOTALL)
+# Regexes of the docstring sections, in the order they are extracted
+_section_regexes = {
+    "parameters": _re_parameters,
+    "returns": _re_returns,
+    "returntype": _re_returntype,
+    "yields": _re_yields,
+    "yieldtype": _re_yieldtype,
+    "raises": _re_raises,
+    "raisederrors": _re_raisederrors,
+}
+# Re pattern that catches any opening or closing tag of a docstring section
+_re_section_tag = re.compile(r"<(/?)(parameters|returns|returntype|yields|yieldtype|raises|raisederrors)>")
+
+
+def _find_section_spans(object_doc):
+    """
+    Finds the span of each docstring section in one pass over `object_doc`. Like the greedy `_section_regexes`, a
+    section goes from its first opening tag to its last closing tag. Returns `None` when two sections overlap, since
+    extracting one then changes what the next regex matches.
+    """
+    spans = {}
+    for match in _re_section_tag.finditer(object_doc):
+        is_closing, tag = match.groups()
+        if not is_closing:
+            if tag not in spans:
+                spans[tag] = [match.start(), match.end(), None, None]
+        elif tag in spans:
+            spans[tag][2:] = [match.start(), match.end()]
+
+    # Sections without closing tag are not matched by their regex.
+    spans = {tag: span for tag, span in spans.items() if span[2] is not None}
+    sorted_spans = sorted(spans.values())
+    for previous_span, span in zip(sorted_spans[:-1], sorted_spans[1:]):
+        if span[0] < previous_span[3]:
+            return None
+    return spans
+
+
+def extract_docstring_sections(object_doc):
+    """
+    Removes the parameters, returns, yields and raises sections from `object_doc`.
+
+    Returns:
+        `Tuple[str, Dict[str, Optional[str]]]`: The docstring without its sections, and the stripped content of each
+        section (`None` if the section is missing or empty).
+    """
+    spans = _find_section_spans(object_doc)
+    if spans is None:
+        sections = {}
+        # Overlapping sections: extract them one after the other, exactly as the regexes see them.
+        for tag, regex in _section_regexes.items():
+            re_match = regex.search(object_doc)
+            sections[tag] = None
+            if re_match:
+                # The section regexes are greedy, so there is at most one match: cut it out instead of a second scan.
+                object_doc = object_doc[: re_match.start()] + object_doc[re_match.end() :]
+                sections[tag] = re_match.group(1).strip() or None
+        return object_doc, sections
+
+    doc_parts = []
+    last_end = 0
+    sections = {tag: None for tag in _section_regexes}
+    for tag, (start, content_start, content_end, end) in sorted(spans.items(), key=lambda item: item[1]):
+        doc_parts.append(object_doc[last_end:start])
+        sections[tag] = object_doc[content_start:content_end].strip() or None
+        last_end = end
+    doc_parts.append(object_doc[last_end:])
+    return "".join(doc_parts), sections
 
 
 def get_signature_component(name, anchor, signature, object_doc, source_link=None, is_getset_desc=False):
@@ -167,29 +262,17 @@ def get_signature_component(name, anchor, signature, object_doc, source_link=Non
             return f"<{tag}>{match_str}"
         return f"<{tag}>{match_str}</{tag}>"
 
-    def regex_closure(object_doc, regex):
-        """
-        This closure matches given regex & removes the matched group from object_doc
-        """
-        re_match = regex.search(object_doc)
-        object_doc = regex.sub("", object_doc)
-        match = None
-        if re_match:
-            _match = re_match.group(1).strip()
-            if len(_match):
-                match = _match
-        return object_doc, match
-
     object_doc = _re_returns.sub(lambda m: inside_example_finder_closure(m, "returns"), object_doc)
     object_doc = _re_parameters.sub(lambda m: inside_example_finder_closure(m, "parameters"), object_doc)
 
-    object_doc, parameters = regex_closure(object_doc, _re_parameters)
-    object_doc, return_description = regex_closure(object_doc, _re_returns)
-    object_doc, returntype = regex_closure(object_doc, _re_returntype)
-    object_doc, yield_description = regex_closure(object_doc, _re_yields)
-    object_doc, yieldtype = regex_closure(object_doc, _re_yieldtype)
-    object_doc, raise_description = regex_closure(object_doc, _re_raises)
-    object_doc, raisederrors = regex_closure(object_doc, _re_raisederrors)
+    object_doc, sections = extract_docstring_sections(object_doc)
+    parameters = sections["parameters"]
+    return_description = sections["returns"]
+    returntype = sections["returntype"]
+    yield_description = sections["yields"]
+    yieldtype = sections["yieldtype"]
+    raise_description = sections["raises"]
+    raisederrors = sections["raisederrors"]
     object_doc = remove_example_tags(object_doc)
     object_doc = hashlink_example_codeblock(object_doc, anchor)
 
@@ -321,8 +404,7 @@ def is_getset_descriptor(obj):
     Returns boolean whether object is `getset_descriptor`.
     """
     # used by tokenizers @property bindings
-    obj_repr = str(type(obj))
-    return "getset_descriptor" in obj_repr
+    return isinstance(obj, types.GetSetDescriptorType)
 
 
 def get_source_link(obj, page_info, version_tag_suffix="src/"):
@@ -335,7 +417,9 @@ def get_source_link(obj, page_info, version_tag_suffix="src/"):
     repo_owner = page_info.get("repo_owner", "huggingface")
     base_link = f"https://github.com/{repo_owner}/{repo_name}/blob/{version_tag}/{version_tag_suffix}"
     module = obj.__module__.replace(".", "/")
-    line_number = inspect.getsourcelines(obj)[1]
+    # Only the line number is needed: `inspect.getsourcelines` would also tokenize the whole object source to extract
+    # it, which is expensive for big classes.
+    line_number = inspect.findsource(inspect.unwrap(obj))[1] + 1
     source_file = inspect.getsourcefile(obj)
     if source_file.endswith("__init__.py"):
         return f"{base_link}{module}/__init__.py#L{line_number}"
@@ -481,11 +565,6 @@ def autodoc(object_name, package, methods=None, return_anchors=False, page_info=
     if return_anchors:
         anchors = [get_shortest_path(obj, package)]
     if isinstance(obj, type):
-        documentation, check = document_object(
-            object_name=object_name, package=package, page_info=page_info, version_tag_suffix=version_tag_suffix
-        )
-        if check is not None:
-            errors.append(check)
         if methods is None:
             methods = find_documented_methods(obj)
         elif "all" in methods:
@@ -520,6 +599,10 @@ def autodoc(object_name, package, methods=None, return_anchors=False, page_info=
     return (documentation, anchors, errors) if return_anchors else documentation
 
 
+# Re pattern that catches links of the form [`SomeClass`] (not followed by an explicit url)
+_re_doc_link = re.compile(r"\[`([^`]+)`\]([^\(])")
+
+
 def resolve_links_in_text(text, package, mapping, page_info):
     """
     Resolve links of the form [`SomeClass`] to the link in the documentation to `SomeClass`.
@@ -584,7 +667,7 @@ def resolve_links_in_text(text, package, mapping, page_info):
         else:
             return f"[{link_name}]({page}#{anchor}){last_char}"
 
-    return re.sub(r"\[`([^`]+)`\]([^\(])", _resolve_link, text)
+    return _re_doc_link.sub(_resolve_link, text)
 
 
 # Re pattern that catches the start of a block code with potential indent.
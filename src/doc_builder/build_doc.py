@@ -15,6 +15,7 @@
 
 
 import importlib
+import io
 import os
 import re
 import shutil
@@ -28,7 +29,7 @@ from .autodoc import autodoc, find_object_in_package, get_source_path, resolve_l
 from .convert_md_to_mdx import convert_md_to_mdx
 from .convert_rst_to_mdx import convert_rst_to_mdx, find_indent, is_empty_line
 from .convert_to_notebook import generate_notebooks_from_file
-from .utils import get_doc_config, read_doc_config
+from .utils import get_doc_config, list_files, read_doc_config
 
 
 _re_autodoc = re.compile(r"^\s*\[\[autodoc\]\]\s+(\S+)\s*$")
@@ -87,6 +88,10 @@ def resolve_autodoc(content, package, return_anchors=False, page_info=None, vers
             For example, the default `"src/"` suffix will result in a base link as `https://github.com/huggingface/{package_name}/blob/{version_tag}/src/`.
             For example, `version_tag_suffix=""` will result in a base link as `https://github.com/huggingface/{package_name}/blob/{version_tag}/`.
     """
+    # Most pages don't document any object, there is no need to scan them line by line.
+    if "[[autodoc]]" not in content:
+        return (content, [], None, []) if return_anchors else content
+
     idx_last_heading = None
     is_inside_codeblock = False
     lines = content.split("\n")
@@ -97,8 +102,10 @@ def resolve_autodoc(content, package, return_anchors=False, page_info=None, vers
         errors = []
     idx = 0
     while idx < len(lines):
-        if _re_autodoc.search(lines[idx]) is not None:
-            object_name = _re_autodoc.search(lines[idx]).groups()[0]
+        # The substring check is a lot cheaper than the regex on the lines without autodoc.
+        autodoc_search = _re_autodoc.search(lines[idx]) if "[[autodoc]]" in lines[idx] else None
+        if autodoc_search is not None:
+            object_name = autodoc_search.groups()[0]
             autodoc_indent = find_indent(lines[idx])
             idx += 1
             while idx < len(lines) and is_empty_line(lines[idx]):
@@ -156,6 +163,18 @@ def resolve_autodoc(content, package, return_anchors=False, page_info=None, vers
     return (new_content, anchors, source_files, errors) if return_anchors else new_content
 
 
+def is_copy_up_to_date(src_file, dest_file):
+    """
+    Checks whether `dest_file` is a copy of `src_file` with the same size and modification time.
+    """
+    try:
+        dest_stat = os.stat(dest_file)
+    except FileNotFoundError:
+        return False
+    src_stat = os.stat(src_file)
+    return src_stat.st_size == dest_stat.st_size and src_stat.st_mtime_ns == dest_stat.st_mtime_ns
+
+
 def build_mdx_files(package, doc_folder, output_dir, page_info, version_tag_suffix):
     """
     Build the MDX files for a given package.
@@ -179,16 +198,18 @@ def build_mdx_files(package, doc_folder, output_dir, page_info, version_tag_suff
     if "package_name" not in page_info:
         page_info["package_name"] = package.__name__
 
-    all_files = list(doc_folder.glob("**/*"))
+    all_files = list_files(doc_folder)
     all_errors = []
     for file in tqdm(all_files, desc="Building the MDX files"):
         new_anchors = None
         errors = None
         page_info["path"] = file
+        # All the output paths are derived from the path relative to the doc folder, so only compute it once.
+        relative_file = file.relative_to(doc_folder)
         try:
             if file.suffix in [".md", ".mdx"]:
-                dest_file = output_dir / (file.with_suffix(".mdx").relative_to(doc_folder))
-                page_info["page"] = file.with_suffix(".html").relative_to(doc_folder).as_posix()
+                dest_file = output_dir / relative_file.with_suffix(".mdx")
+                page_info["page"] = relative_file.with_suffix(".html").as_posix()
                 os.makedirs(dest_file.parent, exist_ok=True)
                 with open(file, "r", encoding="utf-8-sig") as reader:
                     content = reader.read()
@@ -204,8 +225,8 @@ def build_mdx_files(package, doc_folder, output_dir, page_info, version_tag_suff
                 # Make sure we clean up for next page.
                 del page_info["page"]
             elif file.suffix in [".rst"]:
-                dest_file = output_dir / (file.with_suffix(".mdx").relative_to(doc_folder))
-                page_info["page"] = file.with_suffix(".html").relative_to(doc_folder)
+                dest_file = output_dir / relative_file.with_suffix(".mdx")
+                page_info["page"] = relative_file.with_suffix(".html")
                 os.makedirs(dest_file.parent, exist_ok=True)
                 with open(file, "r", encoding="utf-8") as reader:
                     content = reader.read()
@@ -220,17 +241,20 @@ def build_mdx_files(package, doc_folder, output_dir, page_info, version_tag_suff
                     writer.write(content)
                 # Make sure we clean up for next page.
                 del page_info["page"]
-            elif file.is_file() and "__" not in str(file):
-                # __ is a reserved svelte file/folder prefix
-                dest_file = output_dir / (file.relative_to(doc_folder))
+            elif "__" not in str(file) and file.is_file():
+                # __ is a reserved svelte file/folder prefix (checked first as it doesn't need to touch the disk)
+                dest_file = output_dir / relative_file
                 os.makedirs(dest_file.parent, exist_ok=True)
-                shutil.copy(file, dest_file)
+                # Static files (mostly images) rarely change, so don't copy them again if they are up to date.
+                # `copy2` keeps the modification time, which is what makes this check work on the next build.
+                if not is_copy_up_to_date(file, dest_file):
+                    shutil.copy2(file, dest_file)
 
         except Exception as e:
             raise type(e)(f"There was an error when converting {file} to the MDX format.\n" + e.args[0]) from e
 
         if new_anchors is not None:
-            page_name = str(file.with_suffix("").relative_to(doc_folder))
+            page_name = str(relative_file.with_suffix(""))
             for anchor in new_anchors:
                 if isinstance(anchor, tuple):
                     anchor_mapping.update(
@@ -262,13 +286,15 @@ def resolve_links(doc_folder, package, mapping, page_info):
         page_info (`Dict[str, str]`): Some information about the page.
     """
     doc_folder = Path(doc_folder)
-    all_files = list(doc_folder.glob("**/*.mdx"))
+    all_files = list_files(doc_folder, ".mdx")
     for file in tqdm(all_files, desc="Resolving internal links"):
         with open(file, "r", encoding="utf-8") as reader:
             content = reader.read()
-        content = resolve_links_in_text(content, package, mapping, page_info)
-        with open(file, "w", encoding="utf-8") as writer:
-            writer.write(content)
+        new_content = resolve_links_in_text(content, package, mapping, page_info)
+        # Most pages have no link to resolve, there is no need to write them again.
+        if new_content != content:
+            with open(file, "w", encoding="utf-8") as writer:
+                writer.write(new_content)
 
 
 def build_notebooks(doc_folder, notebook_dir, package=None, mapping=None, page_info=None):
@@ -291,14 +317,20 @@ def build_notebooks(doc_folder, notebook_dir, package=None, mapping=None, page_i
     if "package_name" not in page_info:
         page_info["package_name"] = package.__name__
 
-    mdx_files = list(doc_folder.glob("**/*.mdx"))
+    mdx_files = list_files(doc_folder, ".mdx")
     for file in tqdm(mdx_files, desc="Building the notebooks"):
-        with open(file, "r", encoding="utf-8") as f:
-            if "[[open-in-colab]]" not in f.read():
-                continue
+        # Only a few pages have the marker, so look for it in the raw bytes and only decode the pages that have it.
+        with open(file, "rb") as f:
+            raw_content = f.read()
+        if b"[[open-in-colab]]" not in raw_content:
+            continue
+        content = io.TextIOWrapper(io.BytesIO(raw_content), encoding="utf-8").read()
         try:
             page_info["page"] = file.with_suffix(".html").relative_to(doc_folder)
-            generate_notebooks_from_file(file, notebook_dir, package=package, mapping=mapping, page_info=page_info)
+            # We already have the content of the file, no need to read it a second time.
+            generate_notebooks_from_file(
+                file, notebook_dir, package=package, mapping=mapping, page_info=page_info, content=content
+            )
             # Make sure we clean up for next page.
             del page_info["page"]
 
@@ -378,7 +410,7 @@ def build_doc(
 
     if notebook_dir is not None:
         if clean and Path(notebook_dir).exists():
-            for nb_file in Path(notebook_dir).glob("**/*.ipynb"):
+            for nb_file in list_files(notebook_dir, ".ipynb"):
                 os.remove(nb_file)
         build_notebooks(doc_folder, notebook_dir, package=package, mapping=anchors_mapping, page_info=page_info)
 
@@ -424,7 +456,7 @@ def toctree_renamings(output_dir):
         with open(toc_file, "w", encoding="utf-8") as f:
             f.write(yaml.safe_dump(toc))
 
-        doc_files = output_dir.glob("**/*.mdx")
+        doc_files = list_files(output_dir, ".mdx")
         for doc_file in doc_files:
             relative_doc_file = doc_file.relative_to(output_dir)
             local = str(relative_doc_file.with_suffix(""))
@@ -442,7 +474,7 @@ def check_toc_integrity(doc_folder, output_dir):
         output_dir (`str` or `os.PathLike`): The folder where the doc is built.
     """
     output_dir = Path(output_dir)
-    doc_files = [str(f.relative_to(output_dir).with_suffix("")) for f in output_dir.glob("**/*.mdx")]
+    doc_files = [str(f.relative_to(output_dir).with_suffix("")) for f in list_files(output_dir, ".mdx")]
 
     toc_file = Path(doc_folder) / "_toctree.yml"
     with open(toc_file, "r", encoding="utf-8") as f:
@@ -450,9 +482,12 @@ def check_toc_integrity(doc_folder, output_dir):
 
     toc_sections = []
     sphinx_refs = []
-    # We don't just loop directly in toc as we will add more into it as we un-nest things.
-    while len(toc) > 0:
-        part = toc.pop(0)
+    # We don't just loop directly in toc as we will add more into it as we un-nest things. We move an index forward
+    # instead of popping the first item, which would shift the whole list each time.
+    part_idx = 0
+    while part_idx < len(toc):
+        part = toc[part_idx]
+        part_idx += 1
         if "local" in part:
             toc_sections.append(part["local"])
         if "sections" not in part:
@@ -470,7 +505,10 @@ def check_toc_integrity(doc_folder, output_dir):
 
     # normalize paths to current OS
     toc_sections = [str(Path(path)) for path in toc_sections]
-    files_not_in_toc = [f for f in doc_files if f not in toc_sections and not f.endswith("README")]
+    # Sets for the membership tests, the lists are kept to report missing files in order.
+    toc_sections_set = set(toc_sections)
+    doc_files_set = set(doc_files)
+    files_not_in_toc = [f for f in doc_files if f not in toc_sections_set and not f.endswith("README")]
     doc_config = get_doc_config()
     disable_toc_check = getattr(doc_config, "disable_toc_check", False)
     if len(files_not_in_toc) > 0 and not disable_toc_check:
@@ -479,7 +517,7 @@ def check_toc_integrity(doc_folder, output_dir):
             "The following files are not present in the table of contents:\n" + message + f"\nAdd them to {toc_file}."
         )
 
-    files_not_exist = [f for f in toc_sections if f not in doc_files]
+    files_not_exist = [f for f in toc_sections if f not in doc_files_set]
     if len(files_not_exist) > 0:
         message = "\n".join([f"- {f}" for f in files_not_exist])
         raise RuntimeError(
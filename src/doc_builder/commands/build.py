@@ -28,7 +28,7 @@ from doc_builder.utils import (
     get_doc_config,
     locate_kit_folder,
     read_doc_config,
-    sveltify_file_route,
+    sveltify_routes,
 )
 
 
@@ -139,11 +139,7 @@ def build_command(args):
                     shutil.copy(f, dest)
             # make mdx file paths comply with the sveltekit 1.0 routing mechanism
             # see more: https://learn.svelte.dev/tutorial/pages
-            for mdx_file_path in svelte_kit_routes_dir.rglob("*.mdx"):
-                new_path = sveltify_file_route(mdx_file_path)
-                parent_path = os.path.dirname(new_path)
-                os.makedirs(parent_path, exist_ok=True)
-                shutil.move(mdx_file_path, new_path)
+            sveltify_routes(svelte_kit_routes_dir)
 
             # Move the objects.inv file at the root
             if not args.not_python_module:
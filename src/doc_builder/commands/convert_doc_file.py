@@ -64,6 +64,10 @@ def shorten_internal_refs(content):
     return _re_internal_ref.sub(_shorten_ref, content)
 
 
+# Re pattern that matches autodoc lines with fully qualified transformers objects
+_re_autodoc_transformers = re.compile(r"^\[\[autodoc\]\](\s+)(transformers\.)", flags=re.MULTILINE)
+
+
 def convert_rst_file(source_file, output_file, page_info):
     with open(source_file, "r", encoding="utf-8") as f:
         text = f.read()
@@ -71,7 +75,7 @@ def convert_rst_file(source_file, output_file, page_info):
     text = convert_rst_to_mdx(text, page_info, add_imports=False)
     text = text.replace("&amp;lcub;", "{")
     text = text.replace("&amp;lt;", "<")
-    text = re.sub(r"^\[\[autodoc\]\](\s+)(transformers\.)", r"[[autodoc]]\1", text, flags=re.MULTILINE)
+    text = _re_autodoc_transformers.sub(r"[[autodoc]]\1", text)
     text = shorten_internal_refs(text)
 
     with open(output_file, "w", encoding="utf-8") as f:
@@ -16,6 +16,7 @@
 import argparse
 import base64
 import io
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import nbformat
@@ -23,6 +24,7 @@ from PIL import Image
 from tqdm import tqdm
 
 from ..style_doc import format_code_example
+from ..utils import list_files
 
 
 def png_to_jpeg(png_base64):
@@ -83,26 +85,52 @@ def notebook_to_mdx(notebook, max_len):
     return mdx_content
 
 
+def convert_notebook_file(notebook_path, dest_file_path, max_len, colab_link=None):
+    """
+    Converts the notebook at `notebook_path` and writes the result in `dest_file_path`. Defined at the top level so it
+    can be sent to worker processes.
+    """
+    notebook = nbformat.read(notebook_path, as_version=4)
+    mdx_content = notebook_to_mdx(notebook, max_len)
+    if colab_link is not None:
+        colab_link_component = f'<DocNotebookDropdown classNames="absolute z-10 right-0 top-0" options={{[{{label: "Google Colab", value: "{colab_link}"}}]}} />'
+        mdx_content = f"{colab_link_component}\n\n" + mdx_content
+
+    with open(dest_file_path, "w", encoding="utf-8") as f:
+        f.write(mdx_content)
+
+
+def _convert_notebook_file(conversion_args):
+    return convert_notebook_file(*conversion_args)
+
+
 def notebook_to_mdx_command(args):
     src_path = Path(args.notebook_src).resolve()
     src_dir = src_path.parent if src_path.is_file() else src_path
-    notebook_paths = [src_path] if src_path.is_file() else [*src_dir.glob("**/*.ipynb")]
+    notebook_paths = [src_path] if src_path.is_file() else list_files(src_dir, ".ipynb")
 
-    for notebook_path in tqdm(notebook_paths, desc="Converting .ipynb files to .md files"):
-        notebook = nbformat.read(notebook_path, as_version=4)
-        mdx_content = notebook_to_mdx(notebook, args.max_len)
+    conversions = []
+    for notebook_path in notebook_paths:
         mdx_file_name = notebook_path.name[: -len(".ipynb")] + ".md"
         output_dir = notebook_path.parent if args.output_dir is None else Path(args.output_dir).resolve()
         dest_file_path = output_dir / mdx_file_name
 
+        colab_link = None
         if src_path.is_dir() and args.open_notebook_prefix is not None:
             relative_path = notebook_path.relative_to(src_path)
             colab_link = f"{args.open_notebook_prefix}/{str(relative_path)}"
-            colab_link_component = f'<DocNotebookDropdown classNames="absolute z-10 right-0 top-0" options={{[{{label: "Google Colab", value: "{colab_link}"}}]}} />'
-            mdx_content = f"{colab_link_component}\n\n" + mdx_content
-
-        with open(dest_file_path, "w", encoding="utf-8") as f:
-            f.write(mdx_content)
+        conversions.append((notebook_path, dest_file_path, args.max_len, colab_link))
+
+    if len(conversions) <= 1:
+        for conversion_args in conversions:
+            _convert_notebook_file(conversion_args)
+        return
+
+    # Each notebook is converted independently (formatting code with black is the bottleneck), so use all cores.
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(_convert_notebook_file, conversions, chunksize=8)
+        for _ in tqdm(results, total=len(conversions), desc="Converting .ipynb files to .md files"):
+            pass
 
 
 def notebook_to_mdx_command_parser(subparsers=None):
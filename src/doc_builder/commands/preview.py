@@ -27,7 +27,7 @@ from threading import Thread
 from doc_builder import build_doc
 from doc_builder.commands.build import check_node_is_available, locate_kit_folder
 from doc_builder.commands.convert_doc_file import find_root_git
-from doc_builder.utils import is_watchdog_available, read_doc_config, sveltify_file_route
+from doc_builder.utils import is_watchdog_available, read_doc_config, sveltify_file_route, sveltify_routes
 
 
 if is_watchdog_available():
@@ -44,6 +44,8 @@ if is_watchdog_available():
             self.args = args
             self.source_files_mapping = source_files_mapping
             self.kit_routes_folder = kit_routes_folder
+            # Resolved once here rather than on every file system event.
+            self.docs_folder_absolute = str(Path(args.path_to_docs).absolute())
 
         def on_created(self, event):
             super().on_created(event)
@@ -63,8 +65,7 @@ if is_watchdog_available():
             If so, returns mdx file path.
             """
             src_path = event.src_path
-            parent_path_absolute = str(Path(self.args.path_to_docs).absolute())
-            relative_path = event.src_path[len(parent_path_absolute) + 1 :]
+            relative_path = event.src_path[len(self.docs_folder_absolute) + 1 :]
             is_valid_file = False
             if not event.is_directory:
                 if src_path.endswith(".py") and src_path in self.source_files_mapping:
@@ -72,7 +73,7 @@ if is_watchdog_available():
                 # if src_path.endswith(".md"):
                 #     # src_path += "x"
                 #     relative_path += "x"
-                if src_path.endswith(".mdx") or src_path.endswith(".md"):
+                if src_path.endswith((".mdx", ".md")):
                     is_valid_file = True
                     return is_valid_file, src_path, relative_path
             return is_valid_file, src_path, relative_path
@@ -205,11 +206,7 @@ def preview_command(args):
 
         # make mdx file paths comply with the sveltekit 1.0 routing mechanism
         # see more: https://learn.svelte.dev/tutorial/pages
-        for mdx_file_path in kit_routes_folder.rglob("*.mdx"):
-            new_path = sveltify_file_route(mdx_file_path)
-            parent_path = os.path.dirname(new_path)
-            os.makedirs(parent_path, exist_ok=True)
-            shutil.move(mdx_file_path, new_path)
+        sveltify_routes(kit_routes_folder)
 
         # Node
         env = os.environ.copy()
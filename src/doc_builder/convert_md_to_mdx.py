@@ -100,6 +100,10 @@ def edit_on_github(page_info):
     return f'\n\n<EditOnGithub source="{source}" />\n\n'
 
 
+# Re pattern that catches image links to the /imgs/ folder of the doc, in html or markdown
+_re_img_link = re.compile(r"(src=\"|\()/imgs/")
+
+
 def convert_img_links(text, page_info):
     """
     Convert image links to correct URL paths.
@@ -110,10 +114,11 @@ def convert_img_links(text, page_info):
     version = page_info.get("version", "main")
     language = page_info.get("language", "en")
 
-    _re_img_link = re.compile(r"(src=\"|\()/imgs/")
-    while _re_img_link.search(text):
-        text = _re_img_link.sub(rf"\1/docs/{package_name}/{version}/{language}/imgs/", text)
-    return text
+    # Most pages don't have any image, a plain substring check is way cheaper than running the regex.
+    if "/imgs/" not in text:
+        return text
+    # The replacement can't create a new match, so one pass is enough.
+    return _re_img_link.sub(rf"\1/docs/{package_name}/{version}/{language}/imgs/", text)
 
 
 _re_md_img_tag_alt = re.compile(r"!\[([^\]]+)\]", re.I)
@@ -135,13 +140,14 @@ def escape_img_alt_description(text):
         new_alt_content = alt_content.replace("`", "'")
         return match.group(0).replace(alt_content, new_alt_content)
 
-    # Replace markdown style image alt text
-    if _re_md_img_tag_alt.search(text):
-        text = _re_md_img_tag_alt.sub(replace_md_alt_content, text)
+    # Without any `, there is nothing to escape.
+    if "`" not in text:
+        return text
 
+    # Replace markdown style image alt text (sub is a no-op without match, no need to search first)
+    text = _re_md_img_tag_alt.sub(replace_md_alt_content, text)
     # Replace HTML style image alt text
-    if _re_html_img_tag_alt.search(text):
-        text = _re_html_img_tag_alt.sub(replace_html_alt_content, text)
+    text = _re_html_img_tag_alt.sub(replace_html_alt_content, text)
 
     return text
 
@@ -164,6 +170,8 @@ def clean_doctest_syntax(text):
 _re_include_template = r"([ \t]*)<{include_name}>(((?!<{include_name}>).)*)<\/{include_name}>"
 _re_include = re.compile(_re_include_template.format(include_name="include"), re.DOTALL)
 _re_literalinclude = re.compile(_re_include_template.format(include_name="literalinclude"), re.DOTALL)
+# Re pattern that catches trailing non-word characters
+_re_trailing_non_word = re.compile(r"\W+$")
 
 
 def convert_file_include_helper(match, page_info, is_code=True):
@@ -185,12 +193,14 @@ def convert_file_include_helper(match, page_info, is_code=True):
     include = lines  # defaults to entire file
     if "start-after" in include_info or "end-before" in include_info:
         start_after, end_before = -1, -1
+        # Look up the markers once instead of on each line of the included file.
+        start_marker, end_marker = include_info["start-after"], include_info["end-before"]
         for idx, line in enumerate(lines):
             line = line.strip()
-            line = re.sub(r"\W+$", "", line)
-            if line.endswith(include_info["start-after"]):
+            line = _re_trailing_non_word.sub("", line)
+            if line.endswith(start_marker):
                 start_after = idx + 1
-            if line.endswith(include_info["end-before"]):
+            if line.endswith(end_marker):
                 end_before = idx
         if start_after == -1 or end_before == -1:
             raise ValueError(f"The following '{include_name}' does NOT exist:\n{match[0]}")
@@ -204,6 +214,9 @@ def convert_include(text, page_info):
     """
     Convert an `include` into markdown.
     """
+    # Cheap check first, most pages don't include other files.
+    if "<include>" not in text:
+        return text
     text = _re_include.sub(lambda m: convert_file_include_helper(m, page_info, is_code=False), text)
     return text
 
@@ -212,6 +225,8 @@ def convert_literalinclude(text, page_info):
     """
     Convert a `literalinclude` into markdown code blocks.
     """
+    if "<literalinclude>" not in text:
+        return text
     text = _re_literalinclude.sub(lambda m: convert_file_include_helper(m, page_info, is_code=True), text)
     return text
 
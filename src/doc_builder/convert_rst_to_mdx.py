@@ -27,6 +27,8 @@ _re_single_backquotes = re.compile(r"(^|[^`])`([^`]+)`([^`]|$)")
 _re_double_backquotes = re.compile(r"(^|[^`])``([^`]+)``([^`]|$)")
 # Re pattern to catch things inside ` ` in :func/class/meth:`thing`.
 _re_func_class = re.compile(r":(?:func|class|meth):`([^`]+)`")
+# Re pattern to catch the remaining :: at the end of lines.
+_re_double_colon = re.compile(r"::\n")
 
 
 def convert_rst_formatting(text):
@@ -46,29 +48,26 @@ def convert_rst_formatting(text):
     # Convert content in double backquotes to single backquotes.
     text = _re_double_backquotes.sub(r"\1`\2`\3", text)
     # Remove remaining ::
-    text = re.sub(r"::\n", "", text)
+    text = _re_double_colon.sub("", text)
 
     # Remove new lines inside blocks in backsticks as they will be kept.
     lines = text.split("\n")
     in_code = False
-    text = None
+    new_lines = []
     for line in lines:
         if in_code:
             splits = line.split("`")
             in_code = len(splits) > 1 and len(splits) % 2 == 1
             if len(splits) == 1:
                 # Some forgotten lone backstick
-                text += "\n" + line
+                new_lines.append(line)
             else:
-                text += " " + line.lstrip()
+                new_lines[-1] += " " + line.lstrip()
         else:
-            if text is not None:
-                text += "\n" + line
-            else:
-                text = line
+            new_lines.append(line)
             splits = line.split("`")
             in_code = len(splits) % 2 == 0
-    return text
+    return "\n".join(new_lines)
 
 
 # Re pattern to catch description and url in links of the form `description <url>`_.
@@ -83,6 +82,8 @@ _re_doc_with_description = re.compile(r":doc:`([^`<]+\S)\s+</*([^/][^>`]*)>`")
 _re_simple_ref = re.compile(r":ref:`([^`<]*)`")
 # Re pattern to catch description and reference in links of the form :ref:`description <reference>`.
 _re_ref_with_description = re.compile(r":ref:`([^`<]+\S)\s+<([^>]*)>`")
+# Re pattern to catch relative links of the form (./xxx) or (../xxx).
+_re_relative_link = re.compile(r"\(\.+/")
 
 
 def convert_rst_links(text, page_info):
@@ -121,7 +122,7 @@ def convert_rst_links(text, page_info):
     # Other links
     text = _re_links.sub(r"[\1](\2)", text)
     # Relative links or Transformers links need to remove the .html
-    if "(https://https://huggingface.co/" in text or re.search(r"\(\.+/", text) is not None:
+    if "(https://https://huggingface.co/" in text or _re_relative_link.search(text) is not None:
         text = text.replace(".html", "")
     return text
 
@@ -142,13 +143,16 @@ def find_indent(line):
     """
     Returns the number of spaces that start a line indent.
     """
-    search = re.search(r"^(\s*)(?:\S|$)", line)
-    if search is None:
-        return 0
-    return len(search.groups()[0])
+    return len(line) - len(line.lstrip())
 
 
 _re_rst_option = re.compile(r"^\s*:(\S+):(.*)$")
+# Re pattern that catches html void elements with no closing counterpart.
+_re_html_void = re.compile(r"<(img|br|hr|Youtube)")
+# Re pattern that catches html tags with their matching closing tag.
+_re_lt_html = re.compile(r"<(\S+)([^>]*>)(((?!</\1>).)*)<(/\1>)", re.DOTALL)
+# Re pattern that catches single < that are not part of an html tag.
+_re_lt = re.compile(r"(^|[^<])<([^<]|$)")
 
 
 def convert_special_chars(text):
@@ -156,12 +160,16 @@ def convert_special_chars(text):
     Converts { and < that have special meanings in MDX.
     """
     text = text.replace("{", "&amp;lcub;")
+    # Most texts have no <, in which case there is nothing left to convert.
+    if "<" not in text:
+        return text
     # We don't want to replace those by the HTML code, so we temporarily set them at LTHTML
-    text = re.sub(r"<(img|br|hr|Youtube)", r"LTHTML\1", text)  # html void elements with no closing counterpart
-    _re_lt_html = re.compile(r"<(\S+)([^>]*>)(((?!</\1>).)*)<(/\1>)", re.DOTALL)
-    while _re_lt_html.search(text):
-        text = _re_lt_html.sub(r"LTHTML\1\2\3LTHTML\5", text)
-    text = re.sub(r"(^|[^<])<([^<]|$)", r"\1&amp;lt;\2", text)
+    text = _re_html_void.sub(r"LTHTML\1", text)  # html void elements with no closing counterpart
+    # Nested tags need several passes, stop as soon as one pass doesn't replace anything.
+    num_replaced = 1
+    while num_replaced > 0:
+        text, num_replaced = _re_lt_html.subn(r"LTHTML\1\2\3LTHTML\5", text)
+    text = _re_lt.sub(r"\1&amp;lt;\2", text)
     text = text.replace("LTHTML", "<")
     return text
 
@@ -175,8 +183,9 @@ def parse_options(block_content):
     current_option = None
     result = {}
     for line in block_lines:
-        if _re_rst_option.search(line) is not None:
-            current_option, value = _re_rst_option.search(line).groups()
+        option_search = _re_rst_option.search(line)
+        if option_search is not None:
+            current_option, value = option_search.groups()
             result[current_option] = value.lstrip()
         elif find_indent(line) > block_indent:
             result[current_option] += " " + line.lstrip()
@@ -229,14 +238,17 @@ def convert_rst_blocks(text, page_info):
     while idx < len(lines):
         block_type = None
         block_info = None
-        if _re_block.search(lines[idx]) is not None:
-            block_type = _re_block.search(lines[idx]).groups()[0]
-            if _re_block_info.search(lines[idx]) is not None:
-                block_info = _re_block_info.search(lines[idx]).groups()[0]
-        elif _re_example.search(lines[idx]) is not None:
+        block_search = _re_block.search(lines[idx])
+        example_search = _re_example.search(lines[idx]) if block_search is None else None
+        if block_search is not None:
+            block_type = block_search.groups()[0]
+            block_info_search = _re_block_info.search(lines[idx])
+            if block_info_search is not None:
+                block_info = block_info_search.groups()[0]
+        elif example_search is not None:
             block_type = "code-block-example"
             block_info = "python"
-            example_name = _re_example.search(lines[idx]).groups()[0]
+            example_name = example_search.groups()[0]
             new_lines.append(f"<exampletitle>{example_name}:</exampletitle>\n")
         elif lines[idx].strip() == "..":
             block_type = "comment"
@@ -326,6 +338,8 @@ def convert_rst_blocks(text, page_info):
 _re_args = re.compile(r"^\s*(Args?|Arguments?|Attributes?|Params?|Parameters?):\s*$")
 # Re pattern that catches return blocks of the form `Return:`.
 _re_returns = re.compile(r"^\s*(Return|Yield|Raise)s?:\s*$")
+# Re pattern that catches a return type made of a single word between backquotes at the end of a line.
+_re_backquoted_word_end = re.compile(r"`\w+`$")
 
 
 def split_return_line(line):
@@ -337,7 +351,7 @@ def split_return_line(line):
     while idx < len(splits_on_colon) and splits_on_colon[idx] in ["obj", "class"]:
         idx += 2
     if idx >= len(splits_on_colon):
-        if len(splits_on_colon) % 2 == 1 and re.search(r"`\w+`$", line.rstrip()):
+        if len(splits_on_colon) % 2 == 1 and _re_backquoted_word_end.search(line.rstrip()):
             return line, ""
         return None, line
     return ":".join(splits_on_colon[:idx]), ":".join(splits_on_colon[idx:])
@@ -373,6 +387,10 @@ class InvalidRstDocstringError(ValueError):
 
 _re_parameters = re.compile(r"<parameters>(((?!<parameters>).)*)</parameters>", re.DOTALL)
 _re_md_link = re.compile(r"\[(.+)\]\(.+\)", re.DOTALL)
+# Re pattern that catches the name of an argument at the start of its line.
+_re_arg_name = re.compile(r"^\s*(\S+)(\s)?")
+# Re pattern that catches an error name, optionally between backquotes.
+_re_error_name = re.compile(r"^\s*`?([\w\.]*)`?$")
 
 
 def parse_rst_docstring(docstring):
@@ -382,6 +400,7 @@ def parse_rst_docstring(docstring):
     lines = docstring.split("\n")
     idx = 0
     while idx < len(lines):
+        returns_search = _re_returns.search(lines[idx])
         # Parameters section
         if _re_args.search(lines[idx]) is not None:
             # Title of the section.
@@ -401,7 +420,7 @@ def parse_rst_docstring(docstring):
                 if intro.lstrip().startswith(">"):
                     lines[idx] = intro.lstrip()
                 else:
-                    lines[idx] = re.sub(r"^\s*(\S+)(\s)?", r"- **\1**\2", intro) + " --" + doc
+                    lines[idx] = _re_arg_name.sub(r"- **\1**\2", intro) + " --" + doc
                 idx += 1
                 while idx < len(lines) and (is_empty_line(lines[idx]) or find_indent(lines[idx]) > param_indent):
                     idx += 1
@@ -409,9 +428,9 @@ def parse_rst_docstring(docstring):
             idx += 1
 
         # Returns section
-        elif _re_returns.search(lines[idx]) is not None:
+        elif returns_search is not None:
             # tag is either `return` or `yield`
-            tag = _re_returns.match(lines[idx]).group(1).lower()
+            tag = returns_search.group(1).lower()
             # Title of the section.
             lines[idx] = f"<{tag}s>\n"
             # Find the next nonempty line
@@ -432,12 +451,12 @@ def parse_rst_docstring(docstring):
             else:
                 while idx < len(lines) and find_indent(lines[idx]) == return_indent:
                     return_type, return_description = split_raise_line(lines[idx])
-                    raised_error = re.sub(r"^\s*`?([\w\.]*)`?$", r"``\1``", return_type)
+                    raised_error = _re_error_name.sub(r"``\1``", return_type)
                     lines[idx] = "- " + raised_error + " -- " + return_description
                     md_link = _re_md_link.match(raised_error)
                     if md_link:
                         raised_error = md_link[1]
-                        raised_error = re.sub(r"^\s*`?([\w\.]*)`?$", r"``\1``", raised_error)
+                        raised_error = _re_error_name.sub(r"``\1``", raised_error)
                     if raised_error not in raised_errors:
                         raised_errors.append(raised_error)
                     idx += 1
@@ -472,6 +491,8 @@ def parse_rst_docstring(docstring):
 
 _re_list = re.compile(r"^\s*(-|\*|\d+\.)\s")
 _re_autodoc = re.compile(r"^\s*\[\[autodoc\]\]\s+(\S+)\s*$")
+# Re pattern that catches list items starting with a *.
+_re_star_list = re.compile(r"^(\s*)\*(\s)", flags=re.MULTILINE)
 
 
 def remove_indent(text):
@@ -487,14 +508,15 @@ def remove_indent(text):
     code_indent = 0
     for idx, line in enumerate(lines):
         # Line is an item in a list.
-        if _re_list.search(line) is not None:
+        list_search = _re_list.search(line)
+        if list_search is not None:
             indent = find_indent(line)
             # Is it a new list / new level of nestedness?
             if len(current_indents) == 0 or indent > current_indents[-1]:
                 current_indents.append(indent)
                 new_indent = 0 if len(new_indents) == 0 else new_indents[-1]
                 lines[idx] = " " * new_indent + line[indent:]
-                new_indent += len(_re_list.search(line).groups()[0]) + 1
+                new_indent += len(list_search.groups()[0]) + 1
                 new_indents.append(new_indent)
             # Otherwise it's an existing level of list (current one, or previous one)
             else:
@@ -506,7 +528,7 @@ def remove_indent(text):
                 new_indents = new_indents[:level]
                 new_indent = 0 if len(new_indents) == 0 else new_indents[-1]
                 lines[idx] = " " * new_indent + line[indent:]
-                new_indent += len(_re_list.search(line).groups()[0]) + 1
+                new_indent += len(list_search.groups()[0]) + 1
                 new_indents.append(new_indent)
 
         # Line is an autodoc, we keep the indent for the list just after if there is one.
@@ -564,7 +586,7 @@ def base_rst_to_mdx(text, page_info, unindent=True):
     text = convert_special_chars(text)
     text = convert_rst_blocks(text, page_info)
     # Convert * in lists to - to avoid the formatting conversion treat them as bold.
-    text = re.sub(r"^(\s*)\*(\s)", r"\1-\2", text, flags=re.MULTILINE)
+    text = _re_star_list.sub(r"\1-\2", text)
     text = convert_rst_formatting(text)
     return remove_indent(text) if unindent else text
 
@@ -577,9 +599,12 @@ def convert_rst_docstring_to_mdx(docstring, page_info):
     return base_rst_to_mdx(text, page_info)
 
 
+# Characters that can be used to underline titles in rst.
+_TITLE_CHARS = frozenset("""= - ` : ' " ~ ^ _ * + # < >""".split(" "))
+
+
 def process_titles(lines):
     """Converts rst titles to markdown titles."""
-    title_chars = """= - ` : ' " ~ ^ _ * + # < >""".split(" ")
     title_levels = {}
     new_lines = []
     for line in lines:
@@ -587,7 +612,7 @@ def process_titles(lines):
             len(new_lines) > 0
             and len(line) >= len(new_lines[-1])
             and len(set(line)) == 1
-            and line[0] in title_chars
+            and line[0] in _TITLE_CHARS
             and line != "::"
         ):
             char = line[0]
@@ -654,6 +679,35 @@ def split_pt_tf_code_blocks(text):
     return "\n".join(new_lines)
 
 
+# Svelte header added at the top of the MDX files converted from rst
+_MDX_HEADER_LINES = (
+    '<script lang="ts">',
+    '	import Tip from "$lib/Tip.svelte";',
+    '	import Youtube from "$lib/Youtube.svelte";',
+    '	import Docstring from "$lib/Docstring.svelte";',
+    '	import CodeBlock from "$lib/CodeBlock.svelte";',
+    '	import CodeBlockFw from "$lib/CodeBlockFw.svelte";',
+    '	import DocNotebookDropdown from "$lib/DocNotebookDropdown.svelte";',
+    '	import CourseFloatingBanner from "$lib/CourseFloatingBanner.svelte";',
+    '	import IconCopyLink from "$lib/IconCopyLink.svelte";',
+    '	import FrameworkContent from "$lib/FrameworkContent.svelte";',
+    '	import Markdown from "$lib/Markdown.svelte";',
+    '	import ExampleCodeBlock from "$lib/ExampleCodeBlock.svelte";',
+    '	import Added from "$lib/Added.svelte";',
+    '	import Changed from "$lib/Changed.svelte";',
+    '	import Deprecated from "$lib/Deprecated.svelte";',
+    '	import PipelineIcon from "$lib/PipelineIcon.svelte";',
+    '	import PipelineTag from "$lib/PipelineTag.svelte";',
+    "	",
+    '	export let fw: "pt" | "tf"',
+    "</script>",
+    "<svelte:head>",
+    '<meta name="hf:doc:metadata" content={JSON.stringify(metadata)} >',
+    "</svelte:head>",
+    "",
+)
+
+
 def convert_rst_to_mdx(rst_text, page_info, add_imports=True):
     """
     Convert a document written in rst to mdx.
@@ -661,32 +715,7 @@ def convert_rst_to_mdx(rst_text, page_info, add_imports=True):
     lines = rst_text.split("\n")
     lines = process_titles(lines)
     if add_imports:
-        new_lines = [
-            '<script lang="ts">',
-            '	import Tip from "$lib/Tip.svelte";',
-            '	import Youtube from "$lib/Youtube.svelte";',
-            '	import Docstring from "$lib/Docstring.svelte";',
-            '	import CodeBlock from "$lib/CodeBlock.svelte";',
-            '	import CodeBlockFw from "$lib/CodeBlockFw.svelte";',
-            '	import DocNotebookDropdown from "$lib/DocNotebookDropdown.svelte";',
-            '	import CourseFloatingBanner from "$lib/CourseFloatingBanner.svelte";',
-            '	import IconCopyLink from "$lib/IconCopyLink.svelte";',
-            '	import FrameworkContent from "$lib/FrameworkContent.svelte";',
-            '	import Markdown from "$lib/Markdown.svelte";',
-            '	import ExampleCodeBlock from "$lib/ExampleCodeBlock.svelte";',
-            '	import Added from "$lib/Added.svelte";',
-            '	import Changed from "$lib/Changed.svelte";',
-            '	import Deprecated from "$lib/Deprecated.svelte";',
-            '	import PipelineIcon from "$lib/PipelineIcon.svelte";',
-            '	import PipelineTag from "$lib/PipelineTag.svelte";',
-            "	",
-            '	export let fw: "pt" | "tf"',
-            "</script>",
-            "<svelte:head>",
-            '<meta name="hf:doc:metadata" content={JSON.stringify(metadata)} >',
-            "</svelte:head>",
-            "",
-        ]
+        new_lines = list(_MDX_HEADER_LINES)
     else:
         new_lines = []
     for line in lines:
@@ -696,9 +725,10 @@ def convert_rst_to_mdx(rst_text, page_info, add_imports=True):
             continue
         elif _re_sep_line_table.search(line) is not None:
             line = line.replace("=", "-").replace("+", "|")
-        elif _re_anchor_section.search(line) is not None:
-            anchor_name = _re_anchor_section.search(line).groups()[0]
-            line = f"<a id='{anchor_name}'></a>"
+        else:
+            anchor_search = _re_anchor_section.search(line)
+            if anchor_search is not None:
+                line = f"<a id='{anchor_search.groups()[0]}'></a>"
         new_lines.append(line)
     text = "\n".join(new_lines)
 
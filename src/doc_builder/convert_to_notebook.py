@@ -51,15 +51,16 @@ def expand_links(content, page_info):
     page = str(page_info["page"])
 
     prefix = f"https://huggingface.co/docs/{package_name}/{version}/{language}"
+    # Relative links all resolve against the folder of the page, so build that prefix once.
+    page_prefix = "/".join([prefix] + page.split("/")[:-1]) + "/"
 
     def _replace_link(match):
         description, link = match.groups()
-        if link.startswith("http") or link.startswith("#"):
+        if link.startswith(("http", "#")):
             return f"[{description}]({link})"
         elif link.startswith("/docs/"):
             return f"[{description}](https://huggingface.co{link})"
-        link = "/".join([prefix] + page.split("/")[:-1] + [link])
-        return f"[{description}]({link})"
+        return f"[{description}]({page_prefix}{link})"
 
     return _re_markdown_links.sub(_replace_link, content)
 
@@ -96,10 +97,15 @@ def split_frameworks(content):
             idx += 1
             current_lines = []
             current_framework = None
-            while idx < len(lines) and lines[idx].strip() != "</frameworkcontent>":
-                if _re_framework.search(lines[idx]) is not None:
-                    current_framework = _re_framework.search(lines[idx]).groups()[0]
-                elif current_framework is not None and lines[idx].strip() == f"</{current_framework}>":
+            while idx < len(lines):
+                # Strip and search each line only once.
+                stripped_line = lines[idx].strip()
+                if stripped_line == "</frameworkcontent>":
+                    break
+                framework_search = _re_framework.search(lines[idx])
+                if framework_search is not None:
+                    current_framework = framework_search.groups()[0]
+                elif current_framework is not None and stripped_line == f"</{current_framework}>":
                     new_lines[current_framework].extend(current_lines)
                     new_lines["mixed"].extend(current_lines)
                     current_framework = None
@@ -142,7 +148,7 @@ def parse_input_output(code_lines):
             cells.append(("\n".join(current_lines).strip(), None))
             current_lines = [line]
         else:
-            if line.startswith(">>> ") or line.startswith("... "):
+            if line.startswith((">>> ", "... ")):
                 current_lines.append(line[4:])
             else:
                 current_lines.append(line)
@@ -290,7 +296,7 @@ def create_notebook(cells):
     return nbformat.notebooknode.NotebookNode({"cells": cells, "metadata": {}, "nbformat": 4, "nbformat_minor": 4})
 
 
-def generate_notebooks_from_file(file_name, output_dir, package=None, mapping=None, page_info=None):
+def generate_notebooks_from_file(file_name, output_dir, package=None, mapping=None, page_info=None, content=None):
     """
     Generate the notebooks for a given doc file.
 
@@ -304,11 +310,14 @@ def generate_notebooks_from_file(file_name, output_dir, package=None, mapping=No
             links).
         page_info (`Dict[str, str]`, *optional*):
             Some information about the page (needs to be passed to resolve doc links).
+        content (`str`, *optional*):
+            The content of `file_name` if it has already been read. Will be read from `file_name` if not passed.
     """
     output_dirs = [output_dir, os.path.join(output_dir, "pytorch"), os.path.join(output_dir, "tensorflow")]
     output_name = Path(file_name).with_suffix(".ipynb").name
-    with open(file_name, "r", encoding="utf-8") as f:
-        content = f.read()
+    if content is None:
+        with open(file_name, "r", encoding="utf-8") as f:
+            content = f.read()
 
     content = clean_content(content, package=package, mapping=mapping, page_info=page_info)
 
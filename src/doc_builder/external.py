@@ -13,9 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os
 import re
-import tempfile
 import zlib
 
 import git
@@ -36,6 +34,10 @@ HUGGINFACE_LIBS = [
 ]
 
 
+# Types of the objects.inv entries we link to
+_LINKED_OBJECT_TYPES = frozenset({"py:class", "py:function", "py:method"})
+
+
 def post_process_objects_inv(object_data, doc_url):
     """
     Post-processes the data in sphinx-like format to get a dictionary object_name: link in doc.
@@ -48,13 +50,18 @@ def post_process_objects_inv(object_data, doc_url):
     for line in object_data:
         if len(line) == 0:
             continue
-        name, typ, _, link = line.split(" ")[:4]
-        if typ in ["py:class", "py:function", "py:method"]:
+        # The display name at the end of the line may contain spaces, no need to split it.
+        name, typ, _, link = line.split(" ", 4)[:4]
+        if typ in _LINKED_OBJECT_TYPES:
             link = link.replace("$", name)
             links[name] = f"{doc_url}/{link}"
     return links
 
 
+# Re pattern that catches version numbers in tags
+_re_version_tag = re.compile(r"v?\d+\.\d+\.\d+")
+
+
 def get_stable_version(package_name, repo_owner="huggingface", repo_name=None):
     """
     Gets the version of the last release of a package.
@@ -78,7 +85,7 @@ def get_stable_version(package_name, repo_owner="huggingface", repo_name=None):
         # Lines returned are {sha}\trefs/tags/{tag}^{}, we grab the tag
         candidate = line.split("/")[-1].replace("^", "").replace("{}", "")
         # Some tags are not versions (looking at your VERSION and delete tags Datasets)
-        if re.search(r"v?\d+\.\d+\.\d+", candidate):
+        if _re_version_tag.search(candidate) is not None:
             # Add the v is missing (looking at you Datasets :-p)
             return candidate if candidate.startswith("v") else f"v{candidate}"
 
@@ -107,19 +114,12 @@ def get_objects_map(package_name, version="main", language="en", repo_owner="hug
     doc_url = f"{HF_DOC_PREFIX}{package_name}/{package_version}/{language}"
     url = f"{doc_url}/objects.inv"
     try:
-        request = requests.get(url, stream=True)
+        request = requests.get(url)
         request.raise_for_status()
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_file = os.path.join(tmp_dir, "objects.inv")
-            with open(tmp_file, "ab") as writer:
-                for chunk in request.iter_content(chunk_size=1024):
-                    if chunk:  # filter out keep-alive new chunks
-                        writer.write(chunk)
-
-            with open(tmp_file, "rb") as reader:
-                object_lines = reader.readlines()[4:]
-                object_data = zlib.decompress(b"".join(object_lines)).decode().split("\n")
-            return post_process_objects_inv(object_data, doc_url)
+        # The first 4 lines are the uncompressed header of the file, the rest is zlib-compressed.
+        compressed_data = request.content.split(b"\n", 4)[4]
+        object_data = zlib.decompress(compressed_data).decode().split("\n")
+        return post_process_objects_inv(object_data, doc_url)
     except Exception:
         return {}
 
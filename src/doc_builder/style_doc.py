@@ -184,6 +184,10 @@ def format_code_example(code: str, max_len: int, in_docstring: bool = False):
     return result.rstrip(), error
 
 
+# Re pattern that catches any sequence of whitespace
+_re_whitespaces = re.compile(r"\s+")
+
+
 def format_text(text, max_len, prefix="", min_indent=None):
     """
     Format a text in the biggest lines possible with the constraint of a maximum length and an indentation.
@@ -199,7 +203,7 @@ def format_text(text, max_len, prefix="", min_indent=None):
     Returns:
         `str`: The formatted text.
     """
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _re_whitespaces.sub(" ", text).strip()
     if min_indent is not None:
         if len(prefix) < min_indent:
             prefix = " " * (min_indent - len(prefix)) + prefix
@@ -391,6 +395,10 @@ def style_docstrings_in_code(code, max_len=119):
     Returns:
         `Tuple[str, str]`: A tuple with the clean code and the black errors (if any)
     """
+    # Without any triple quotes, there is no docstring to style.
+    if '"""' not in code:
+        return code, ""
+
     # fmt: off
     splits = code.split('\"\"\"')
     splits = [
@@ -448,6 +456,10 @@ def style_mdx_file(mdx_file, max_len=119, check_only=False):
     with open(mdx_file, "r", encoding="utf-8", newline="\n") as f:
         content = f.read()
 
+    # Only the code samples are styled, so a file without any code block is left as is.
+    if "```" not in content:
+        return False, ""
+
     lines = content.split("\n")
     current_code = []
     current_language = ""
@@ -503,12 +515,17 @@ def style_doc_files(*files, max_len=119, check_only=False):
     """
     changed = []
     black_errors = []
-    for file in files:
+    # Folders are expanded on an explicit stack instead of recursive calls. Items are pushed in reverse so they are
+    # treated in the same depth-first order.
+    files_to_treat = list(files)[::-1]
+    while len(files_to_treat) > 0:
+        file = files_to_treat.pop()
         # Treat folders
         if os.path.isdir(file):
-            files = [os.path.join(file, f) for f in os.listdir(file)]
-            files = [f for f in files if os.path.isdir(f) or f.endswith(".mdx") or f.endswith(".py")]
-            changed += style_doc_files(*files, max_len=max_len, check_only=check_only)
+            # `scandir` entries know whether they are folders without an extra `stat` call per file.
+            with os.scandir(file) as entries:
+                sub_files = [entry.path for entry in entries if entry.is_dir() or entry.name.endswith((".mdx", ".py"))]
+            files_to_treat.extend(sub_files[::-1])
         # Treat mdx
         elif file.endswith(".mdx"):
             try:
@@ -13,15 +13,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import bisect
+import functools
 import importlib.machinery
 import importlib.util
 import os
+import re
 import shutil
 import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import yaml
-from packaging import version as package_version
+
+
+try:
+    # Use the C parser/emitter when PyYAML was built with libyaml.
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+    from yaml import SafeLoader as _Loader
 
 
 hf_cache_home = os.path.expanduser(
@@ -29,6 +43,18 @@ hf_cache_home = os.path.expanduser(
 )
 default_cache_path = os.path.join(hf_cache_home, "doc_builder")
 DOC_BUILDER_CACHE = os.getenv("DOC_BUILDER_CACHE", default_cache_path)
+# Number of seconds during which the cached doc-builder repo is used without pulling the latest changes
+DOC_BUILDER_CACHE_TTL = int(os.getenv("DOC_BUILDER_CACHE_TTL", 3600))
+DOC_BUILDER_REPO_URL = "https://github.com/huggingface/doc-builder.git"
+
+# Re pattern matching a line of `_versions.yml` holding a version that YAML leaves as a plain, unquoted string
+_re_plain_version_line = re.compile(r"^- version: ([A-Za-z][\w.\-]*)$")
+# Plain scalars that YAML would not load as strings
+_YAML_NON_STRING_WORDS = {"y", "n", "yes", "no", "on", "off", "true", "false", "null"}
+
+
+# Default branch of each git repo already queried, keyed by real path
+_default_branch_cache = {}
 
 
 def get_default_branch_name(repo_folder):
@@ -36,20 +62,23 @@ def get_default_branch_name(repo_folder):
     if config is not None and hasattr(config, "default_branch_name"):
         print(config.default_branch_name)
         return config.default_branch_name
+    repo_key = os.path.realpath(repo_folder)
+    if repo_key in _default_branch_cache:
+        return _default_branch_cache[repo_key]
     try:
         p = subprocess.run(
-            "git symbolic-ref refs/remotes/origin/HEAD".split(),
-            stderr=subprocess.PIPE,
+            ["git", "symbolic-ref", "refs/remotes/origin/HEAD"],
+            stderr=subprocess.DEVNULL,
             stdout=subprocess.PIPE,
             check=True,
-            encoding="utf-8",
             cwd=repo_folder,
         )
-        branch = p.stdout.strip().split("/")[-1]
-        return branch
+        branch = p.stdout.decode("utf-8", "replace").strip().split("/")[-1]
     except Exception:
         # Just in case git is not installed, we need a default
-        return "main"
+        branch = "main"
+    _default_branch_cache[repo_key] = branch
+    return branch
 
 
 def update_versions_file(build_path, version, doc_folder):
@@ -57,35 +86,84 @@ def update_versions_file(build_path, version, doc_folder):
     Insert new version into _versions.yml file of the library
     Assumes that _versions.yml exists and has its first entry as main version
     """
+    # Only needed here, so don't pay for the import when just reading the doc config.
+    from packaging import version as package_version
+
     main_branch = get_default_branch_name(doc_folder)
     if version == main_branch:
         return
-    with open(os.path.join(build_path, "_versions.yml"), "r") as versions_file:
-        versions = yaml.load(versions_file, yaml.FullLoader)
-
-        if versions[0]["version"] != main_branch:
-            raise ValueError(f"{build_path}/_versions.yml does not contain a {main_branch} version")
-
-        main_version, sem_versions = versions[0], versions[1:]
-        new_version = {"version": version}
-        did_insert = False
-        for i, value in enumerate(sem_versions):
-            if package_version.parse(new_version["version"]) == package_version.parse(value["version"]):
-                # Nothing to do, the version is here already.
-                return
-            elif package_version.parse(new_version["version"]) > package_version.parse(value["version"]):
-                sem_versions.insert(i, new_version)
-                did_insert = True
-                break
-        if not did_insert:
-            sem_versions.append(new_version)
-
-    with open(os.path.join(build_path, "_versions.yml"), "w") as versions_file:
-        versions_updated = [main_version] + sem_versions
-        yaml.dump(versions_updated, versions_file)
+    versions_path = os.path.join(build_path, "_versions.yml")
+    with open(versions_path, "r", encoding="utf-8") as versions_file:
+        content = versions_file.read()
+
+    # `_versions.yml` is almost always a plain list of `- version: X` lines, which we edit without the YAML parser.
+    # Set `DOC_BUILDER_YAML_VERSIONS` to always go through PyYAML.
+    use_yaml = os.getenv("DOC_BUILDER_YAML_VERSIONS") is not None or not _is_plain_version(version)
+    versions = None if use_yaml else _parse_plain_versions(content)
+    if versions is None:
+        use_yaml = True
+        versions = yaml.load(content, _Loader)
+
+    if versions[0]["version"] != main_branch:
+        raise ValueError(f"{build_path}/_versions.yml does not contain a {main_branch} version")
+
+    main_version, sem_versions = versions[0], versions[1:]
+    new_version = {"version": version}
+    if len(sem_versions) == 0:
+        # Nothing to compare with, so the new version doesn't need to be parsed (it may not follow PEP 440).
+        sem_versions.append(new_version)
+    else:
+        new_parsed = package_version.parse(version)
+        parsed_versions = [package_version.parse(value["version"]) for value in sem_versions]
+        if new_parsed in set(parsed_versions):
+            # Nothing to do, the version is here already.
+            return
+        # Versions are sorted from the most recent to the oldest, bisect works on ascending lists.
+        insert_idx = len(parsed_versions) - bisect.bisect_right(parsed_versions[::-1], new_parsed)
+        sem_versions.insert(insert_idx, new_version)
+
+    versions_updated = [main_version] + sem_versions
+    # Write to a temporary file first so readers never see a partially written _versions.yml.
+    versions_file = tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=build_path, suffix=".yml", delete=False)
+    try:
+        with versions_file:
+            if use_yaml:
+                yaml.dump(versions_updated, versions_file, Dumper=_Dumper, default_flow_style=False)
+            else:
+                versions_file.write("".join(f"- version: {value['version']}\n" for value in versions_updated))
+        shutil.copymode(versions_path, versions_file.name)
+        os.replace(versions_file.name, versions_path)
+    except BaseException:
+        # The temporary file is in the built doc folder, which gets uploaded, so it can't be left behind.
+        os.remove(versions_file.name)
+        raise
+
+
+def _is_plain_version(version):
+    """
+    Whether `version` is dumped by YAML as is (without quotes) and loaded back as a string.
+    """
+    match = _re_plain_version_line.search(f"- version: {version}")
+    return match is not None and version.lower() not in _YAML_NON_STRING_WORDS
+
+
+def _parse_plain_versions(content):
+    """
+    Parses the content of a `_versions.yml` file made only of `- version: X` lines with plain versions. Returns `None`
+    if the file has any other content, in which case it needs to go through the YAML parser.
+    """
+    versions = []
+    for line in content.splitlines():
+        match = _re_plain_version_line.search(line)
+        if match is None or match.groups()[0].lower() in _YAML_NON_STRING_WORDS:
+            return None
+        versions.append({"version": match.groups()[0]})
+    return versions if len(versions) > 0 else None
 
 
 doc_config = None
+# Modules of the `_config.py` files already executed, keyed by real path and modification time
+_doc_config_cache = {}
 
 
 def read_doc_config(doc_folder):
@@ -94,11 +172,17 @@ def read_doc_config(doc_folder):
     """
     global doc_config
 
-    if os.path.isfile(os.path.join(doc_folder, "_config.py")):
-        loader = importlib.machinery.SourceFileLoader("doc_config", os.path.join(doc_folder, "_config.py"))
-        spec = importlib.util.spec_from_loader("doc_config", loader)
-        doc_config = importlib.util.module_from_spec(spec)
-        loader.exec_module(doc_config)
+    config_file = os.path.realpath(os.path.join(doc_folder, "_config.py"))
+    if os.path.isfile(config_file):
+        # The modification time is part of the key so an edited config (in preview mode for instance) is reloaded.
+        cache_key = (config_file, os.stat(config_file).st_mtime_ns)
+        if cache_key not in _doc_config_cache:
+            loader = importlib.machinery.SourceFileLoader("doc_config", config_file)
+            spec = importlib.util.spec_from_loader("doc_config", loader)
+            module = importlib.util.module_from_spec(spec)
+            loader.exec_module(module)
+            _doc_config_cache[cache_key] = module
+        doc_config = _doc_config_cache[cache_key]
 
 
 def get_doc_config():
@@ -115,6 +199,14 @@ def is_watchdog_available():
     return importlib.util.find_spec("watchdog") is not None
 
 
+def is_pygit2_available():
+    """
+    Checks if soft dependency `pygit2` exists.
+    """
+    return importlib.util.find_spec("pygit2") is not None
+
+
+@functools.lru_cache(maxsize=8)
 def is_doc_builder_repo(path):
     """
     Detects whether a folder is the `doc_builder` or not.
@@ -127,12 +219,21 @@ def is_doc_builder_repo(path):
     return first_line == "# Doc-builder package setup.\n"
 
 
-def locate_kit_folder():
+def locate_kit_folder(cwd=None):
     """
     Returns the location of the `kit` folder of `doc-builder`.
 
     Will clone the doc-builder repo and cache it, if it's not found.
+
+    Args:
+        cwd (`str` or `os.PathLike`, *optional*):
+            The directory to start searching from for a doc-builder repo. Defaults to the current working directory.
     """
+    return _locate_kit_folder(os.path.abspath(cwd if cwd is not None else os.getcwd()))
+
+
+@functools.lru_cache(maxsize=8)
+def _locate_kit_folder(cwd):
     # First try: let's search where the module is.
     repo_root = Path(__file__).parent.parent.parent
     kit_folder = repo_root / "kit"
@@ -140,7 +241,7 @@ def locate_kit_folder():
         return kit_folder
 
     # Second try, maybe we are inside the doc-builder repo
-    current_dir = Path.cwd()
+    current_dir = Path(cwd)
     while current_dir.parent != current_dir and not (current_dir / ".git").is_dir():
         current_dir = current_dir.parent
     kit_folder = current_dir / "kit"
@@ -157,31 +258,77 @@ def get_cached_repo():
     """
     os.makedirs(DOC_BUILDER_CACHE, exist_ok=True)
     cache_repo_path = Path(DOC_BUILDER_CACHE) / "doc-builder-repo"
+    # Touched each time the cache is cloned or updated.
+    refresh_stamp = cache_repo_path / ".git" / "doc_builder_last_refresh"
     if not cache_repo_path.is_dir():
         print(
             "To build the HTML doc, we need the kit subfolder of the `doc-builder` repo. Cloning it and caching at "
             f"{cache_repo_path}."
         )
-        _ = subprocess.run(
-            "git clone https://github.com/huggingface/doc-builder.git".split(),
-            stderr=subprocess.PIPE,
-            check=True,
-            encoding="utf-8",
-            cwd=DOC_BUILDER_CACHE,
-        )
-        shutil.move(Path(DOC_BUILDER_CACHE) / "doc-builder", cache_repo_path)
+        if is_pygit2_available():
+            import pygit2
+
+            pygit2.clone_repository(DOC_BUILDER_REPO_URL, str(cache_repo_path))
+        else:
+            _ = subprocess.run(
+                ["git", "clone", DOC_BUILDER_REPO_URL],
+                stderr=subprocess.PIPE,
+                check=True,
+                encoding="utf-8",
+                cwd=DOC_BUILDER_CACHE,
+            )
+            shutil.move(Path(DOC_BUILDER_CACHE) / "doc-builder", cache_repo_path)
+    elif refresh_stamp.is_file() and time.time() - refresh_stamp.stat().st_mtime < DOC_BUILDER_CACHE_TTL:
+        # The cache was updated recently, don't hit the network again.
+        return cache_repo_path
+    elif is_pygit2_available():
+        import pygit2
+
+        # Update the cache in-process instead of spawning `git pull`.
+        repo = pygit2.Repository(str(cache_repo_path))
+        repo.remotes["origin"].fetch()
+        remote_ref = repo.lookup_reference(f"refs/remotes/origin/{repo.head.shorthand}")
+        repo.checkout_tree(repo.get(remote_ref.target))
+        repo.head.set_target(remote_ref.target)
     else:
+        # Only stderr is kept (for the error raised on failure), the output is not needed.
         _ = subprocess.run(
             ["git", "pull"],
             stderr=subprocess.PIPE,
-            stdout=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
             check=True,
-            encoding="utf-8",
             cwd=cache_repo_path,
         )
+    refresh_stamp.touch()
     return cache_repo_path
 
 
+def list_files(folder, suffix=None):
+    """
+    Recursively lists all the files inside a folder, optionally only keeping the ones with a given suffix.
+
+    This uses `os.scandir` which is a lot faster than `Path.glob("**/*")` on big doc trees, as it does not need to
+    `stat` every entry or create a `Path` for each folder and file explored.
+
+    Args:
+        folder (`str` or `os.PathLike`): The folder to explore.
+        suffix (`str`, *optional*): If passed, only the files with a name ending with `suffix` are returned.
+
+    Returns:
+        `List[pathlib.Path]`: The sorted list of files found.
+    """
+    files = []
+    folders = [os.fspath(folder)]
+    while len(folders) > 0:
+        with os.scandir(folders.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    folders.append(entry.path)
+                elif suffix is None or entry.name.endswith(suffix):
+                    files.append(entry.path)
+    return [Path(f) for f in sorted(files)]
+
+
 def sveltify_file_route(filename):
     """
     Given `filename` /path/abc/xyz.mdx, return /path/abc/xyz/+page.svelte
@@ -193,3 +340,25 @@ def sveltify_file_route(filename):
         # Replace the '{name}.mdx' with '{name}/+page.svelte'
         return filename.rsplit(".", 1)[0] + "/+page.svelte"
     return filename
+
+
+def sveltify_routes(routes_folder):
+    """
+    Moves all the MDX files in `routes_folder` to the location expected by the sveltekit 1.0 routing mechanism (see
+    [`sveltify_file_route`]). The moves are I/O-bound so they are run in a thread pool.
+
+    Args:
+        routes_folder (`str` or `os.PathLike`): The `src/routes` folder of the kit.
+    """
+    moves = [(mdx_file, sveltify_file_route(mdx_file)) for mdx_file in list_files(routes_folder, ".mdx")]
+    # Create each destination folder once before the moves start.
+    created_dirs = set()
+    for _, new_path in moves:
+        parent_path = os.path.dirname(new_path)
+        if parent_path not in created_dirs:
+            os.makedirs(parent_path, exist_ok=True)
+            created_dirs.add(parent_path)
+
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        # Consume the iterator so exceptions raised in the workers are propagated.
+        list(executor.map(lambda move: shutil.move(*move), moves))
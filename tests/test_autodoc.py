@@ -24,6 +24,7 @@ import transformers
 from doc_builder.autodoc import (
     autodoc,
     document_object,
+    extract_docstring_sections,
     find_documented_methods,
     find_object_in_package,
     format_signature,
@@ -162,10 +163,32 @@ class AutodocTester(unittest.TestCase):
         # Test with an object not in the module
         self.assertIsNone(find_object_in_package("Dataset", transformers))
 
+        # Keyword and positional calls share the same cached result
+        self.assertIs(
+            find_object_in_package(object_name="BertModel", package=transformers),
+            find_object_in_package("BertModel", transformers),
+        )
+
     def test_remove_example_tags(self):
         text = "<example>aaa</example>bbb\n<exampletitle>ccc</exampletitle>\n\n<example>ddd</example>"
         self.assertEqual(remove_example_tags(text), "aaabbb\nccc\n\nddd")
 
+    def test_extract_docstring_sections(self):
+        text = "aaa\n<parameters>\nbbb\n</parameters>\nccc\n<returns>ddd</returns><returntype> </returntype>eee"
+        object_doc, sections = extract_docstring_sections(text)
+        self.assertEqual(object_doc, "aaa\n\nccc\neee")
+        self.assertEqual(sections["parameters"], "bbb")
+        self.assertEqual(sections["returns"], "ddd")
+        self.assertIsNone(sections["returntype"])
+        self.assertIsNone(sections["raises"])
+
+        # Overlapping sections are extracted one after the other.
+        text = "<returns>aaa<parameters>bbb</returns>ccc</parameters>"
+        object_doc, sections = extract_docstring_sections(text)
+        self.assertEqual(object_doc, "<returns>aaa")
+        self.assertEqual(sections["parameters"], "bbb</returns>ccc")
+        self.assertIsNone(sections["returns"])
+
     def test_get_shortest_path(self):
         self.assertEqual(get_shortest_path(BertModel, transformers), "transformers.BertModel")
         self.assertEqual(get_shortest_path(BertModel.forward, transformers), "transformers.BertModel.forward")
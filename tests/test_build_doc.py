@@ -13,9 +13,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import shutil
+import tempfile
 import unittest
 
-from doc_builder.build_doc import _re_autodoc, _re_list_item, resolve_open_in_colab
+from doc_builder.build_doc import (
+    _re_autodoc,
+    _re_list_item,
+    build_notebooks,
+    check_toc_integrity,
+    is_copy_up_to_date,
+    resolve_autodoc,
+    resolve_open_in_colab,
+)
 
 
 class BuildDocTester(unittest.TestCase):
@@ -45,3 +56,62 @@ class BuildDocTester(unittest.TestCase):
             resolve_open_in_colab("\n[[open-in-colab]]\n", {"package_name": "transformers", "page": "quicktour.html"}),
             expected,
         )
+
+    def test_resolve_autodoc_without_autodoc(self):
+        content = "# Quicktour\n\nSome text with `[[autodoc]]` inline.\n"
+        self.assertEqual(resolve_autodoc("# Quicktour\n\nSome text.\n", None), "# Quicktour\n\nSome text.\n")
+        self.assertEqual(resolve_autodoc(content, None, return_anchors=True), (content, [], None, []))
+
+    def test_is_copy_up_to_date(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            src_file = os.path.join(tmp_dir, "logo.png")
+            dest_file = os.path.join(tmp_dir, "copy.png")
+            with open(src_file, "wb") as f:
+                f.write(b"logo")
+            self.assertFalse(is_copy_up_to_date(src_file, dest_file))
+
+            shutil.copy2(src_file, dest_file)
+            self.assertTrue(is_copy_up_to_date(src_file, dest_file))
+
+            with open(src_file, "wb") as f:
+                f.write(b"new logo")
+            self.assertFalse(is_copy_up_to_date(src_file, dest_file))
+
+    def test_build_notebooks(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            doc_folder = os.path.join(tmp_dir, "docs")
+            notebook_dir = os.path.join(tmp_dir, "notebooks")
+            os.makedirs(os.path.join(doc_folder, "guides"))
+            with open(os.path.join(doc_folder, "guides", "quicktour.mdx"), "w", encoding="utf-8") as f:
+                f.write("# Quicktour\n\n[[open-in-colab]]\n\n```py\n>>> import transformers\n```\n")
+            with open(os.path.join(doc_folder, "index.mdx"), "w", encoding="utf-8") as f:
+                f.write("# Index\n")
+
+            build_notebooks(doc_folder, notebook_dir, page_info={"package_name": "transformers"})
+            self.assertEqual(sorted(os.listdir(notebook_dir)), ["pytorch", "quicktour.ipynb", "tensorflow"])
+            for folder in ["pytorch", "tensorflow"]:
+                self.assertEqual(os.listdir(os.path.join(notebook_dir, folder)), ["quicktour.ipynb"])
+
+    def test_check_toc_integrity(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            doc_folder = os.path.join(tmp_dir, "docs")
+            output_dir = os.path.join(tmp_dir, "build")
+            os.makedirs(doc_folder)
+            os.makedirs(os.path.join(output_dir, "sub"))
+            with open(os.path.join(doc_folder, "_toctree.yml"), "w", encoding="utf-8") as f:
+                f.write("- sections:\n  - local: b\n    title: B\n  - local: sub/a\n    title: A\n  title: Start\n")
+            for name in ["b.mdx", "sub/a.mdx"]:
+                open(os.path.join(output_dir, name), "w").close()
+
+            check_toc_integrity(doc_folder, output_dir)
+            # Relative output folders (like the current one) must give the same page names.
+            current_dir = os.getcwd()
+            try:
+                os.chdir(output_dir)
+                check_toc_integrity(doc_folder, ".")
+            finally:
+                os.chdir(current_dir)
+
+            open(os.path.join(output_dir, "c.mdx"), "w").close()
+            with self.assertRaises(RuntimeError):
+                check_toc_integrity(doc_folder, output_dir)
@@ -14,12 +14,14 @@
 # limitations under the License.
 
 
+import os
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 import yaml
-from doc_builder.utils import sveltify_file_route, update_versions_file
+from doc_builder.utils import list_files, sveltify_file_route, sveltify_routes, update_versions_file
 
 
 class UtilsTester(unittest.TestCase):
@@ -67,6 +69,60 @@ class UtilsTester(unittest.TestCase):
                 expected_yml = "- version: main\n- version: v4.2.2\n"
                 self.assertEqual(yml_str, expected_yml)
 
+        # test versions that need quoting in yml
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(f"{tmp_dir}/_versions.yml", "w") as tmp_yml:
+                versions = [{"version": "main"}, {"version": "v4.2.3"}, {"version": "4.2.1"}]
+                yaml.dump(versions, tmp_yml)
+            update_versions_file(tmp_dir, "4.2.2", repo_folder)
+            update_versions_file(tmp_dir, "v4.2.4", repo_folder)
+            with open(f"{tmp_dir}/_versions.yml", "r") as tmp_yml:
+                versions = yaml.safe_load(tmp_yml)
+                expected_versions = ["main", "v4.2.4", "v4.2.3", "4.2.2", "4.2.1"]
+                self.assertEqual([v["version"] for v in versions], expected_versions)
+
+        # test a first version that doesn't follow PEP 440 is just appended
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(f"{tmp_dir}/_versions.yml", "w") as tmp_yml:
+                yaml.dump([{"version": "main"}], tmp_yml)
+            update_versions_file(tmp_dir, "yes", repo_folder)
+            with open(f"{tmp_dir}/_versions.yml", "r") as tmp_yml:
+                versions = yaml.safe_load(tmp_yml)
+                self.assertEqual([v["version"] for v in versions], ["main", "yes"])
+
+        # test entries with several keys are written like PyYAML's default dump
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(f"{tmp_dir}/_versions.yml", "w") as tmp_yml:
+                yaml.dump([{"version": "main"}, {"version": "v1.0.0", "other": "x"}], tmp_yml, sort_keys=False)
+            update_versions_file(tmp_dir, "v1.1.0", repo_folder)
+            with open(f"{tmp_dir}/_versions.yml", "r") as tmp_yml:
+                yml_str = tmp_yml.read()
+                expected_yml = "- version: main\n- version: v1.1.0\n- other: x\n  version: v1.0.0\n"
+                self.assertEqual(yml_str, expected_yml)
+
+        # test a failed update doesn't leave a temporary file in the build folder
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with open(f"{tmp_dir}/_versions.yml", "w") as tmp_yml:
+                yaml.dump([{"version": "main"}], tmp_yml)
+            with patch("doc_builder.utils.shutil.copymode", side_effect=OSError("copymode failed")):
+                self.assertRaises(OSError, update_versions_file, tmp_dir, "v4.2.2", repo_folder)
+            self.assertEqual(os.listdir(tmp_dir), ["_versions.yml"])
+            with open(f"{tmp_dir}/_versions.yml", "r") as tmp_yml:
+                self.assertEqual(tmp_yml.read(), "- version: main\n")
+
+    def test_list_files(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_dir = Path(tmp_dir)
+            for name in ["index.mdx", "main_classes/model.mdx", "main_classes/deep/trainer.mdx", "imgs/logo.png"]:
+                (tmp_dir / name).parent.mkdir(parents=True, exist_ok=True)
+                (tmp_dir / name).touch()
+
+            expected = ["imgs/logo.png", "index.mdx", "main_classes/deep/trainer.mdx", "main_classes/model.mdx"]
+            self.assertEqual([f.relative_to(tmp_dir).as_posix() for f in list_files(tmp_dir)], expected)
+
+            expected = ["index.mdx", "main_classes/deep/trainer.mdx", "main_classes/model.mdx"]
+            self.assertEqual([f.relative_to(tmp_dir).as_posix() for f in list_files(tmp_dir, ".mdx")], expected)
+
     def test_sveltify_file_route(self):
         mdx_file_path = "guide.mdx"
         svelte_file_path = sveltify_file_route(mdx_file_path)
@@ -82,3 +138,23 @@ class UtilsTester(unittest.TestCase):
         svelte_file_path = sveltify_file_route(mdx_file_path)
         expected_path = "/xyz/abc/guide/+page.svelte"
         self.assertEqual(svelte_file_path, expected_path)
+
+    def test_sveltify_routes(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_dir = Path(tmp_dir)
+            for name in ["index.mdx", "main_classes/model.mdx", "main_classes/trainer.mdx", "_toctree.yml"]:
+                (tmp_dir / name).parent.mkdir(parents=True, exist_ok=True)
+                (tmp_dir / name).write_text(name)
+
+            sveltify_routes(tmp_dir)
+            files = [f.relative_to(tmp_dir).as_posix() for f in list_files(tmp_dir)]
+            self.assertEqual(
+                files,
+                [
+                    "_toctree.yml",
+                    "index/+page.svelte",
+                    "main_classes/model/+page.svelte",
+                    "main_classes/trainer/+page.svelte",
+                ],
+            )
+            self.assertEqual((tmp_dir / "main_classes/model/+page.svelte").read_text(), "main_classes/model.mdx")